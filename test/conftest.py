@@ -6,6 +6,7 @@ __license__ = "GPL version 3"
 __email__ = "info@gispo.fi"
 __revision__ = "$Format:%H$"
 
+from functools import lru_cache
 from typing import Tuple
 
 import pytest
@@ -34,13 +35,17 @@ def task_runner(initialize_logger):
     return TestTaskRunner()
 
 
-@pytest.fixture()
+@lru_cache(maxsize=None)
+def load_fixture(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
 def file_fixture() -> Tuple[str, bytes, str]:
-    with open("test/fixtures/file.xml", "rb") as f:
-        yield "file.xml", f.read(), "text/xml"
+    return "file.xml", load_fixture("test/fixtures/file.xml"), "text/xml"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def another_file_fixture() -> Tuple[str, bytes, str]:
-    with open("test/fixtures/text.txt", "rb") as f:
-        yield "text.txt", f.read(), "text/plain"
+    return "text.txt", load_fixture("test/fixtures/text.txt"), "text/plain"
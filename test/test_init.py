@@ -5,43 +5,44 @@ __revision__ = "$Format:%H$"
 __date__ = "17/10/2010"
 __license__ = "GPL"
 __copyright__ = "Copyright 2012, Australia Indonesia Facility for Disaster Reduction"
-import configparser
+from typing import FrozenSet
 
 import pytest
 
 from ..testing.utilities import is_running_in_tools_module_ci
-from ..tools.resources import plugin_path
+from ..tools.resources import fast_parse_metadata, plugin_path
 
-
-@pytest.mark.skipif(is_running_in_tools_module_ci(), reason="In CI")
-def test_read_init():
-    """Test that the plugin __init__ will validate on plugins.qgis.org."""
-
-    # You should update this list according to the latest in
-    # https://github.com/qgis/qgis-django/blob/master/qgis-app/
-    #        plugins/validator.py
-
-    required_metadata = [
+# You should update this list according to the latest in
+# https://github.com/qgis/qgis-django/blob/master/qgis-app/
+#        plugins/validator.py
+REQUIRED_METADATA = frozenset(
+    {
         "name",
         "description",
         "version",
         "qgisMinimumVersion",
         "email",
         "author",
-    ]
+    }
+)
 
+
+@pytest.fixture(scope="session")
+def plugin_metadata() -> FrozenSet[str]:
     file_path = plugin_path("metadata.txt")
-    metadata = []
-    parser = configparser.ConfigParser()
-    parser.optionxform = str
-    parser.read(file_path)
+    metadata = fast_parse_metadata(file_path)
     message = f'Cannot find a section named "general" in {file_path}'
-    assert parser.has_section("general"), message
-    metadata.extend(parser.items("general"))
+    assert "general" in metadata, message
+    return frozenset(metadata["general"])
+
 
-    for expectation in required_metadata:
-        message = (
-            f'Cannot find metadata "{expectation}" in metadata source ({file_path}).'
-        )
+@pytest.mark.skipif(is_running_in_tools_module_ci(), reason="In CI")
+def test_read_init(plugin_metadata):
+    """Test that the plugin __init__ will validate on plugins.qgis.org."""
 
-        assert expectation in dict(metadata), message
+    missing = REQUIRED_METADATA - plugin_metadata
+    message = (
+        f"Cannot find metadata {sorted(missing)} in metadata source "
+        f'({plugin_path("metadata.txt")}).'
+    )
+    assert not missing, message
@@ -3,12 +3,75 @@ __license__ = "GPL version 3"
 __email__ = "info@gispo.fi"
 __revision__ = "$Format:%H$"
 
-from qgis.core import QgsWkbTypes
+import pytest
+from qgis.core import (
+    QgsExpression,
+    QgsExpressionContextScope,
+    QgsFeature,
+    QgsField,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+from qgis.PyQt.QtCore import QVariant
 
-from ..tools.layers import LayerType
+from ..tools.exceptions import QgsPluginExpressionException
+from ..tools.layers import (
+    LayerType,
+    evaluate_expressions,
+    evaluate_prepared,
+    get_field_index,
+    prepare_expression_context,
+)
 
 
 def test_layer_type():
     assert LayerType.from_wkb_type(QgsWkbTypes.CurvePolygonZM) == LayerType.Polygon
     assert LayerType.from_wkb_type(QgsWkbTypes.MultiPoint) == LayerType.Point
     assert LayerType.from_wkb_type(QgsWkbTypes.MultiLineString25D) == LayerType.Line
+
+
+def test_get_field_index_follows_field_changes():
+    layer = QgsVectorLayer("Point?field=a:integer&field=b:string", "test", "memory")
+    assert get_field_index(layer, "b") == 1
+
+    layer.dataProvider().deleteAttributes([0])
+    layer.dataProvider().addAttributes([QgsField("c", QVariant.Int)])
+    layer.updateFields()
+
+    assert get_field_index(layer, "b") == 0
+    assert get_field_index(layer, "c") == 1
+    with pytest.raises(KeyError):
+        get_field_index(layer, "a")
+
+
+def test_evaluate_prepared():
+    layer = QgsVectorLayer("Point?field=a:integer", "test", "memory")
+    features = []
+    for value in range(3):
+        feature = QgsFeature(layer.fields())
+        feature.setAttribute("a", value)
+        features.append(feature)
+
+    exp = QgsExpression('"a" * 2')
+    context = prepare_expression_context(layer)
+
+    assert [evaluate_prepared(exp, context, feature) for feature in features] == [
+        0,
+        2,
+        4,
+    ]
+
+
+def test_evaluate_expressions_parser_error():
+    with pytest.raises(QgsPluginExpressionException):
+        evaluate_expressions(QgsExpression("1 +"))
+
+
+def test_prepare_expression_context_keeps_scopes_intact():
+    layer = QgsVectorLayer("Point?field=a:integer", "test", "memory")
+    scopes = [QgsExpressionContextScope()]
+
+    context = prepare_expression_context(layer, scopes)
+
+    assert len(scopes) == 1
+    assert context.scopeCount() == 2
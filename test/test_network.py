@@ -8,7 +8,34 @@ import json
 import pytest
 
 from ..tools.exceptions import QgsPluginNetworkException
-from ..tools.network import download_to_file, fetch, post
+from ..tools.network import (
+    _content_disposition_filename,
+    download_to_file,
+    fetch,
+    fetch_many,
+    post,
+)
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ('attachment; filename="file name.txt"', "file name.txt"),
+        ("attachment; filename=file.zip; size=3", "file.zip"),
+        ("attachment; filename='file.nc'", "file.nc"),
+        ("attachment; filename*=UTF-8''na%C3%AFve.txt", "naïve.txt"),
+        ("attachment; filename*=x-foo''a%41.txt", "aA.txt"),
+        (
+            "attachment; filename=\"fallback.txt\"; filename*=UTF-8''real%20name.txt",
+            "real name.txt",
+        ),
+        ("attachment; filename*=UTF-8''..%2F..%2Fetc%2Fpasswd", "passwd"),
+        ('attachment; filename=".."', ""),
+        ("inline", ""),
+    ],
+)
+def test_content_disposition_filename(header, expected):
+    assert _content_disposition_filename(header) == expected
 
 
 def test_fetch(qgis_new_project):
@@ -29,6 +56,12 @@ def test_fetch_params(qgis_new_project):
     assert data["args"] == {"foo": "bar"}
 
 
+def test_fetch_many(qgis_new_project):
+    urls = [f"https://httpbin.org/get?page={page}" for page in range(3)]
+    contents = fetch_many(urls)
+    assert [json.loads(content)["url"] for content in contents] == urls
+
+
 def test_post(qgis_new_project):
     data = post("https://httpbin.org/post")
     data = json.loads(data)
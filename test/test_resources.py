@@ -0,0 +1,32 @@
+__copyright__ = "Copyright 2020-2021, Gispo Ltd"
+__license__ = "GPL version 3"
+__email__ = "info@gispo.fi"
+__revision__ = "$Format:%H$"
+
+from ..tools.resources import fast_parse_metadata
+
+
+def test_fast_parse_metadata(tmp_path):
+    metadata = tmp_path / "metadata.txt"
+    metadata.write_text(
+        "# comment\n"
+        "[general]\n"
+        "name = Test plugin\n"
+        "qgisMinimumVersion=3.16\n"
+        "about=First line\n"
+        "    continued line\n"
+        "; tags = ignored\n"
+        "\n"
+        "[other]\n"
+        "url = https://example.com/?a=b\n",
+        encoding="utf8",
+    )
+
+    assert fast_parse_metadata(str(metadata)) == {
+        "general": {
+            "name": "Test plugin",
+            "qgisMinimumVersion": "3.16",
+            "about": "First line",
+        },
+        "other": {"url": "https://example.com/?a=b"},
+    }
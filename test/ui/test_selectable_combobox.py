@@ -0,0 +1,114 @@
+import pytest
+from qgis.core import QgsVectorLayer
+from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtGui import QStandardItem
+from qgis.PyQt.QtWidgets import QComboBox
+
+from ...widgets.selectable_combobox import CheckableComboBox, CheckableFieldComboBox
+
+__copyright__ = "Copyright 2021, qgis_plugin_tools contributors"
+__license__ = "GPL version 3"
+__email__ = "info@gispo.fi"
+
+
+def _item(text, checked=False):
+    item = QStandardItem(text)
+    item.setData(text)
+    item.setCheckable(True)
+    item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+    return item
+
+
+def _assert_selection(checkable, expected):
+    assert checkable.selected_items() == expected
+    assert checkable.combo.lineEdit().text() == ", ".join(expected)
+
+
+@pytest.fixture()
+def combo(qtbot):
+    combo = QComboBox()
+    qtbot.addWidget(combo)
+    return combo
+
+
+@pytest.fixture()
+def checkable(combo):
+    checkable = CheckableComboBox(combo)
+    for text in ("b", "c", "a"):
+        checkable.append_row(_item(text))
+    return checkable
+
+
+def test_toggle_item(checkable):
+    checkable.model.item(1).setCheckState(Qt.Checked)
+    _assert_selection(checkable, ["c"])
+
+    checkable.model.item(2).setCheckState(Qt.Checked)
+    _assert_selection(checkable, ["c", "a"])
+
+    checkable.model.item(1).setCheckState(Qt.Unchecked)
+    _assert_selection(checkable, ["a"])
+
+
+def test_set_selected_items(checkable):
+    checkable.set_selected_items(["a", "b"])
+    _assert_selection(checkable, ["b", "a"])
+
+    checkable.set_selected_items(("c",))
+    _assert_selection(checkable, ["c"])
+
+
+def test_select_all_clicked(checkable):
+    checkable.select_all_clicked()
+    _assert_selection(checkable, ["b", "c", "a"])
+
+
+def test_insert_row_above_checked_row(checkable):
+    checkable.model.item(1).setCheckState(Qt.Checked)
+
+    checkable.model.insertRow(0, _item("z"))
+    _assert_selection(checkable, ["c"])
+
+    checkable.model.insertRow(0, _item("y", checked=True))
+    _assert_selection(checkable, ["y", "c"])
+
+    # "c" has moved from row 1 to row 3
+    checkable.model.item(3).setCheckState(Qt.Unchecked)
+    _assert_selection(checkable, ["y"])
+
+
+def test_sort(checkable):
+    checkable.set_selected_items(["a", "b"])
+
+    checkable.model.sort(0)
+    _assert_selection(checkable, ["a", "b"])
+
+    # "a" has moved from row 2 to row 0
+    checkable.model.item(0).setCheckState(Qt.Unchecked)
+    _assert_selection(checkable, ["b"])
+
+
+def test_clear(checkable):
+    checkable.set_selected_items(["a"])
+
+    checkable.model.clear()
+    _assert_selection(checkable, [])
+
+    checkable.append_row(_item("d", checked=True))
+    _assert_selection(checkable, ["d"])
+
+
+def test_set_layer(combo):
+    layer = QgsVectorLayer("Point?field=a:integer&field=b:string", "test", "memory")
+    checkable = CheckableFieldComboBox(combo)
+    checkable.set_layer(layer)
+    _assert_selection(checkable, [])
+
+    checkable.set_selected_items(["b"])
+    _assert_selection(checkable, ["b"])
+
+    checkable.set_layer(layer)
+    _assert_selection(checkable, [])
+
+    checkable.set_selected_items(["a", "b"])
+    _assert_selection(checkable, ["a", "b"])
@@ -1,6 +1,7 @@
 # flake8: noqa N802
 """Base class algorithm."""
 from os.path import isfile
+from typing import Optional
 
 from qgis.core import QgsProcessingAlgorithm
 from qgis.PyQt.QtGui import QIcon
@@ -14,6 +15,10 @@ __revision__ = "$Format:%H$"
 
 
 class BaseProcessingAlgorithm(QgsProcessingAlgorithm):
+    # resolved once per algorithm class, see icon()
+    _cached_icon: Optional[QIcon] = None
+    _icon_resolved: bool = False
+
     def __init__(self):
         super().__init__()
 
@@ -24,8 +29,14 @@ class BaseProcessingAlgorithm(QgsProcessingAlgorithm):
         return super().flags() | QgsProcessingAlgorithm.FlagHideFromModeler
 
     def icon(self):
-        icon = resources_path("icons", "icon.png")
-        return QIcon(icon) if isfile(icon) else super().icon()
+        cls = type(self)
+        if not cls.__dict__.get("_icon_resolved", False):
+            icon = resources_path("icons", "icon.png")
+            cls._cached_icon = QIcon(icon) if isfile(icon) else None
+            cls._icon_resolved = True
+        if cls._cached_icon is not None:
+            return cls._cached_icon
+        return super().icon()
 
     def shortHelpString(self):
         raise NotImplementedError
@@ -22,10 +22,10 @@ def log_if_fails(fn: Callable) -> Callable:
     def wrapper(*args: Any, **kwargs: Any) -> None:  # noqa: ANN001
         try:
             # Qt injects False into some signals
-            if args[1:] != (False,):
-                fn(*args, **kwargs)
+            if len(args) == 2 and args[1] is False:
+                fn(args[0], **kwargs)
             else:
-                fn(*args[:-1], **kwargs)
+                fn(*args, **kwargs)
         except QgsPluginException as e:
             MsgBar.exception(e, **e.bar_msg)
         except Exception as e:
@@ -38,10 +38,10 @@ def taskify(fn: Callable) -> Callable:
     """
     Decoration used to turn any function or method into a FunctionTask task.
     """
-    from functools import wraps
+    from functools import partial, wraps
 
     @wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> FunctionTask:  # noqa: ANN001
-        return FunctionTask(lambda: fn(*args, **kwargs))
+        return FunctionTask(partial(fn, *args, **kwargs))
 
     return wrapper
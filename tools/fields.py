@@ -1,4 +1,5 @@
-from typing import Type, Union
+from functools import lru_cache
+from typing import Callable, Dict, Type, Union
 
 from qgis.core import QgsApplication, QgsFields
 from qgis.gui import QgsDateTimeEdit, QgsDoubleSpinBox, QgsSpinBox
@@ -12,82 +13,111 @@ __email__ = "info@gispo.fi"
 __revision__ = "$Format:%H$"
 
 
+_INTEGER_VARIANTS = frozenset(
+    {QVariant.Int, QVariant.UInt, QVariant.LongLong, QVariant.ULongLong}
+)
+_DATETIMELIKE_VARIANTS = frozenset({QVariant.DateTime, QVariant.Time})
+
+_TYPE_ICON_PATHS = {
+    **dict.fromkeys(_INTEGER_VARIANTS, "/mIconFieldInteger.svg"),
+    QVariant.Bool: "/mIconFieldBool.svg",
+    QVariant.Double: "/mIconFieldFloat.svg",
+    QVariant.String: "/mIconFieldText.svg",
+    QVariant.Date: "/mIconFieldDate.svg",
+    QVariant.DateTime: "/mIconFieldDateTime.svg",
+    QVariant.Time: "/mIconFieldTime.svg",
+    QVariant.ByteArray: "/mIconFieldBinary.svg",
+}
+
+
 # noinspection PyCallByClass,PyArgumentList
+@lru_cache(maxsize=16)
 def variant_type_icon(field_type: QVariant) -> QIcon:
-    if field_type == QVariant.Bool:
-        return QgsApplication.getThemeIcon("/mIconFieldBool.svg")
-    elif field_type in [
-        QVariant.Int,
-        QVariant.UInt,
-        QVariant.LongLong,
-        QVariant.ULongLong,
-    ]:
-        return QgsApplication.getThemeIcon("/mIconFieldInteger.svg")
-    elif field_type == QVariant.Double:
-        return QgsApplication.getThemeIcon("/mIconFieldFloat.svg")
-    elif field_type == QVariant.String:
-        return QgsApplication.getThemeIcon("/mIconFieldText.svg")
-    elif field_type == QVariant.Date:
-        return QgsApplication.getThemeIcon("/mIconFieldDate.svg")
-    elif field_type == QVariant.DateTime:
-        return QgsApplication.getThemeIcon("/mIconFieldDateTime.svg")
-    elif field_type == QVariant.Time:
-        return QgsApplication.getThemeIcon("/mIconFieldTime.svg")
-    elif field_type == QVariant.ByteArray:
-        return QgsApplication.getThemeIcon("/mIconFieldBinary.svg")
-    else:
-        return QIcon()
+    path = _TYPE_ICON_PATHS.get(field_type)
+    return QgsApplication.getThemeIcon(path) if path is not None else QIcon()
 
 
-def widget_for_field(field_type: QVariant) -> QWidget:
+def _make_check_box() -> QWidget:
+    return QCheckBox()
+
+
+def _make_int_spin_box() -> QWidget:
+    spin_box = QgsSpinBox()
+    spin_box.setMaximum(2147483647)
+    return spin_box
+
+
+def _make_double_spin_box() -> QWidget:
+    spin_box = QgsDoubleSpinBox()
+    spin_box.setMaximum(2147483647)
+    return spin_box
+
+
+def _make_date_edit() -> QWidget:
+    return QDateEdit()
+
+
+def _make_date_time_edit() -> QWidget:
+    return QgsDateTimeEdit()
+
+
+def _make_combo_box() -> QWidget:
     q_combo_box = QComboBox()
     q_combo_box.setEditable(True)
+    return q_combo_box
+
+
+_WIDGET_FACTORIES: Dict[QVariant, Callable[[], QWidget]] = {
+    **dict.fromkeys(_INTEGER_VARIANTS, _make_int_spin_box),
+    **dict.fromkeys(_DATETIMELIKE_VARIANTS, _make_date_time_edit),
+    QVariant.Bool: _make_check_box,
+    QVariant.Double: _make_double_spin_box,
+    QVariant.Date: _make_date_edit,
+}
+
+
+def widget_for_field(field_type: QVariant) -> QWidget:
+    return _WIDGET_FACTORIES.get(field_type, _make_combo_box)()
+
+
+def _date_time_edit_value(widget: QgsDateTimeEdit) -> str:
+    date_time = widget.dateTime()
+    if not date_time.isValid():
+        return ""
+    return date_time.toPyDateTime().isoformat(sep=" ", timespec="seconds")
+
+
+_WidgetValue = Union[str, bool, float, int]
+
+_VALUE_EXTRACTORS: Dict[type, Callable[[QWidget], _WidgetValue]] = {
+    QgsSpinBox: lambda widget: widget.value(),
+    QgsDoubleSpinBox: lambda widget: widget.value(),
+    QComboBox: lambda widget: widget.currentText(),
+    QCheckBox: lambda widget: widget.isChecked(),
+    QgsDateTimeEdit: _date_time_edit_value,
+}
+
+
+@lru_cache(maxsize=32)
+def _value_extractor(widget_class: type) -> Callable[[QWidget], _WidgetValue]:
+    for cls in widget_class.__mro__:
+        extractor = _VALUE_EXTRACTORS.get(cls)
+        if extractor is not None:
+            return extractor
+    return lambda widget: str(widget.text())
+
 
-    if field_type == QVariant.Bool:
-        return QCheckBox()
-    elif field_type in [
-        QVariant.Int,
-        QVariant.UInt,
-        QVariant.LongLong,
-        QVariant.ULongLong,
-    ]:
-        spin_box = QgsSpinBox()
-        spin_box.setMaximum(2147483647)
-        return spin_box
-    elif field_type == QVariant.Double:
-        spin_box = QgsDoubleSpinBox()
-        spin_box.setMaximum(2147483647)
-        return spin_box
-    elif field_type == QVariant.String:
-        return q_combo_box
-    elif field_type == QVariant.Date:
-        return QDateEdit()
-    elif field_type == QVariant.DateTime:
-        return QgsDateTimeEdit()
-    elif field_type == QVariant.Time:
-        return QgsDateTimeEdit()
-    elif field_type == QVariant.ByteArray:
-        return q_combo_box
-    else:
-        return q_combo_box
-
-
-def value_for_widget(widget: Type[QWidget]) -> Union[str, bool, float, int]:
-    if isinstance(widget, QComboBox):
-        return widget.currentText()
-    elif isinstance(widget, QCheckBox):
-        return widget.isChecked()
-    elif isinstance(widget, QgsDateTimeEdit):
-        return widget.dateTime().toString("yyyy-MM-dd hh:mm:ss")
-    elif isinstance(widget, (QgsSpinBox, QgsDoubleSpinBox)):
-        return widget.value()
-    else:
-        return str(widget.text())
+def value_for_widget(widget: Type[QWidget]) -> _WidgetValue:
+    return _value_extractor(type(widget))(widget)
 
 
 def provider_fields(fields: QgsFields) -> QgsFields:
+    origin = QgsFields.OriginProvider
+    field_origin = fields.fieldOrigin
+    field_at = fields.at
     flds = QgsFields()
+    append = flds.append
     for i in range(fields.count()):
-        if fields.fieldOrigin(i) == QgsFields.OriginProvider:
-            flds.append(fields.at(i))
+        if field_origin(i) == origin:
+            append(field_at(i))
     return flds
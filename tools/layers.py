@@ -6,7 +6,7 @@ __email__ = "info@gispo.fi"
 __revision__ = "$Format:%H$"
 
 import logging
-from typing import List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Union
 
 from qgis.core import (
     QgsExpression,
@@ -31,6 +31,9 @@ except ImportError:
 
 LOGGER = logging.getLogger(__name__)
 
+# field indices by layer id, cleared when the fields of the layer are updated
+_FIELD_INDEX_CACHE: Dict[str, Dict[str, int]] = {}
+
 POINT_TYPES = {
     QgsWkbTypes.Point,
     QgsWkbTypes.MultiPoint,
@@ -56,14 +59,8 @@ class LayerType(enum.Enum):
 
     @staticmethod
     def from_wkb_type(wkb_type: int) -> "LayerType":
-        return next(
-            (
-                l_type
-                for l_type in LayerType
-                if QgsWkbTypes.flatType(wkb_type) in l_type.wkb_types
-            ),
-            LayerType.Unknown,
-        )
+        flat_type = QgsWkbTypes.flatType(wkb_type)
+        return _WKB_TO_LAYER_TYPE.get(flat_type, LayerType.Unknown)
 
     @staticmethod
     def from_layer(layer: QgsVectorLayer) -> "LayerType":
@@ -78,6 +75,11 @@ class LayerType(enum.Enum):
         return self.value["wkb_types"]
 
 
+_WKB_TO_LAYER_TYPE: Dict[int, LayerType] = {
+    wkb_type: l_type for l_type in LayerType for wkb_type in l_type.wkb_types
+}
+
+
 def set_temporal_settings(
     layer: QgsVectorLayer,
     dt_field: str,
@@ -102,6 +104,51 @@ def set_temporal_settings(
     tprops.setIsActive(True)
 
 
+def prepare_expression_context(
+    layer: Optional[QgsMapLayer] = None,
+    context_scopes: Optional[List[QgsExpressionContextScope]] = None,
+) -> QgsExpressionContext:
+    """
+    Create an expression context that can be reused for evaluating
+    expressions against multiple features with evaluate_prepared
+    :param layer: Optional QgsMapLayer
+    :param context_scopes: Optional list of QgsExpressionContextScopes
+    :return: expression context with the scopes appended
+    """
+    context = QgsExpressionContext()
+    if context_scopes:
+        context.appendScopes(context_scopes)
+    if layer:
+        context.appendScope(QgsExpressionContextUtils.layerScope(layer))
+    return context
+
+
+def evaluate_prepared(
+    exp: QgsExpression,
+    context: QgsExpressionContext,
+    feature: Optional[QgsFeature] = None,
+) -> Union[bool, int, str, float, None]:
+    """
+    Evaluate a QGIS expression using a context from prepare_expression_context
+    :param exp: QGIS expression
+    :param context: QgsExpressionContext
+    :param feature: Optional QgsFeature
+    :return: evaluated value of the expression
+    """
+    if feature is not None:
+        context.setFeature(feature)
+
+    value = exp.evaluate(context)
+    if exp.hasEvalError():
+        # an expression that failed to parse also fails to evaluate
+        if exp.hasParserError():
+            error = exp.parserErrorString()
+        else:
+            error = exp.evalErrorString()
+        raise QgsPluginExpressionException(bar_msg=bar_msg(error))
+    return value
+
+
 def evaluate_expressions(
     exp: QgsExpression,
     feature: Optional[QgsFeature] = None,
@@ -116,22 +163,11 @@ def evaluate_expressions(
     :param context_scopes: Optional list of QgsExpressionContextScopes
     :return: evaluated value of the expression
     """
-    context = QgsExpressionContext()
-    scopes = context_scopes if context_scopes is not None else []
-
-    if layer:
-        scopes.append(QgsExpressionContextUtils.layerScope(layer))
-    context.appendScopes(scopes)
-    if feature:
-        context.setFeature(feature)
-
-    value = exp.evaluate(context)
     if exp.hasParserError():
         raise QgsPluginExpressionException(bar_msg=bar_msg(exp.parserErrorString()))
 
-    if exp.hasEvalError():
-        raise QgsPluginExpressionException(bar_msg=bar_msg(exp.evalErrorString()))
-    return value
+    context = prepare_expression_context(layer, context_scopes)
+    return evaluate_prepared(exp, context, feature)
 
 
 def get_field_index(layer: QgsVectorLayer, field_name: str) -> int:
@@ -141,13 +177,27 @@ def get_field_index(layer: QgsVectorLayer, field_name: str) -> int:
     :param field_name: name of the field
     :return: index of the field
     """
-    field_index = layer.fields().indexFromName(field_name)
-    if field_index == -1:
-        raise KeyError(
-            tr(
-                "Field name {} does not exist in layer {}",
-                field_name,
-                layer.name(),
+    field_indices = _layer_field_indices(layer)
+    field_index = field_indices.get(field_name)
+    if field_index is None:
+        field_index = layer.fields().indexFromName(field_name)
+        if field_index == -1:
+            raise KeyError(
+                tr(
+                    "Field name {} does not exist in layer {}",
+                    field_name,
+                    layer.name(),
+                )
             )
-        )
+        field_indices[field_name] = field_index
     return field_index
+
+
+def _layer_field_indices(layer: QgsVectorLayer) -> Dict[str, int]:
+    layer_id = layer.id()
+    field_indices = _FIELD_INDEX_CACHE.get(layer_id)
+    if field_indices is None:
+        field_indices = _FIELD_INDEX_CACHE[layer_id] = {}
+        layer.updatedFields.connect(field_indices.clear)
+        layer.willBeDeleted.connect(lambda: _FIELD_INDEX_CACHE.pop(layer_id, None))
+    return field_indices
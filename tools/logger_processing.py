@@ -1,5 +1,6 @@
 # flake8: noqa N802
 import logging
+from typing import Callable
 
 from qgis.core import QgsProcessingFeedback
 
@@ -11,6 +12,17 @@ __revision__ = "$Format:%H$"
 LOGGER = logging.getLogger(__name__)
 
 
+def _feedback_method(name: str, attr_name: str, log: Callable[[str], None]) -> Callable:
+    """Create a feedback method storing the text to attr_name and logging it"""
+
+    def method(self, text):
+        self._push(attr_name, log, text)
+
+    method.__name__ = name
+    method.__qualname__ = f"LoggerProcessingFeedBack.{name}"
+    return method
+
+
 class LoggerProcessingFeedBack(QgsProcessingFeedback):
     def __init__(self, use_logger=False):
         super().__init__()
@@ -31,38 +43,23 @@ class LoggerProcessingFeedBack(QgsProcessingFeedback):
     def last(self, text):
         self._last = text
 
-    def setProgressText(self, text):
+    def _push(self, attr_name, log, text):
         self._last = text
-        self.last_progress_text = text
+        setattr(self, attr_name, text)
         if self.use_logger:
-            LOGGER.info(text)
+            log(text)
 
-    def pushInfo(self, text):
-        self._last = text
-        self.last_push_info = text
-        if self.use_logger:
-            LOGGER.info(text)
-
-    def pushCommandInfo(self, text):
-        self._last = text
-        self.last_command_info = text
-        if self.use_logger:
-            LOGGER.info(text)
-
-    def pushDebugInfo(self, text):
-        self._last = text
-        self.last_debug_info = text
-        if self.use_logger:
-            LOGGER.warning(text)
-
-    def pushConsoleInfo(self, text):
-        self._last = text
-        self.last_console_info = text
-        if self.use_logger:
-            LOGGER.info(text)
+    setProgressText = _feedback_method(
+        "setProgressText", "last_progress_text", LOGGER.info
+    )
+    pushInfo = _feedback_method("pushInfo", "last_push_info", LOGGER.info)
+    pushCommandInfo = _feedback_method(
+        "pushCommandInfo", "last_command_info", LOGGER.info
+    )
+    pushDebugInfo = _feedback_method("pushDebugInfo", "last_debug_info", LOGGER.warning)
+    pushConsoleInfo = _feedback_method(
+        "pushConsoleInfo", "last_console_info", LOGGER.info
+    )
 
     def reportError(self, text, fatalError=False):
-        self._last = text
-        self.last_report_error = text
-        if self.use_logger:
-            LOGGER.exception(text)
+        self._push("last_report_error", LOGGER.exception, text)
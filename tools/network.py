@@ -1,13 +1,21 @@
+import http.cookiejar
 import json
 import logging
 import re
+import secrets
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Literal, NamedTuple, Optional, Tuple
-from urllib.parse import urlencode
-from uuid import uuid4
+from urllib.parse import unquote, urlencode
 
-from qgis.core import Qgis, QgsBlockingNetworkRequest, QgsNetworkReplyContent
+from qgis.core import (
+    Qgis,
+    QgsApplication,
+    QgsBlockingNetworkRequest,
+    QgsNetworkReplyContent,
+)
 from qgis.PyQt.QtCore import QByteArray, QSettings, QUrl
 from qgis.PyQt.QtNetwork import QNetworkReply, QNetworkRequest
 
@@ -18,9 +26,11 @@ from .custom_logging import bar_msg
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from requests.exceptions import RequestException
 except ImportError:
     requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
     RequestException = None  # type: ignore
 
 __copyright__ = "Copyright 2020-2023, Gispo Ltd"
@@ -34,6 +44,11 @@ CONTENT_DISPOSITION_HEADER = "Content-Disposition"
 CONTENT_DISPOSITION_BYTE_HEADER = QByteArray(
     bytes(CONTENT_DISPOSITION_HEADER, ENCODING)
 )
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+_CD_FILENAME_RE = re.compile(r'filename(\*?)=(?:"([^"]*)"|([^;]+))')
+
+# created on first use by _requests_session
+_SESSION: Optional["requests.Session"] = None
 
 
 class FileInfo(NamedTuple):
@@ -105,6 +120,42 @@ def fetch_raw(
     return request_raw(url, "get", encoding, authcfg_id, params)
 
 
+def fetch_many(
+    urls: List[str],
+    encoding: str = ENCODING,
+    *,
+    authcfg_id: str = "",
+    max_workers: int = 8,
+) -> List[bytes]:
+    """
+    Fetch multiple resources from the internet concurrently.
+    Requests are made with request_raw in a thread pool. May be called from the
+    main thread, which keeps processing Qt events while waiting, or from a
+    worker thread such as a QgsTask
+    :param urls: addresses of the web resources
+    :param encoding: Encoding which will be used to decode the bytes
+    :param authcfg_id: authcfg id from QGIS settings, defaults to ''
+    :param max_workers: maximum number of concurrent requests
+    :return: bytes of the contents in the same order as the urls
+    """
+    # the calling plugin cannot be found from the stack of a pool thread
+    user_agent = _user_agent(plugin_name(), encoding)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                request_raw, url, "get", encoding, authcfg_id, user_agent=user_agent
+            )
+            for url in urls
+        ]
+        # QGIS handles proxy authentication, SSL errors and auth challenges
+        # of worker threads in the main thread, so its events must be processed
+        not_done = set(futures)
+        while not_done:
+            QgsApplication.processEvents()
+            _, not_done = wait(not_done, timeout=0.05)
+        return [future.result()[0] for future in futures]
+
+
 def post_raw(
     url: str,
     encoding: str = ENCODING,
@@ -125,6 +176,25 @@ def post_raw(
     return request_raw(url, "post", encoding, authcfg_id, None, data, files)
 
 
+@lru_cache(maxsize=8)
+def _user_agent(name: str, encoding: str) -> bytes:
+    """
+    Build the User-Agent header for requests made by the plugin.
+    The value is cached, call _user_agent.cache_clear() if the QGIS
+    user agent setting is changed at runtime.
+    :param name: name of the plugin making the request
+    :param encoding: Encoding which will be used to encode the header
+    :return: bytes of the header value
+    """
+    # http://osgeo-org.1560.x6.nabble.com/QGIS-Developer-Do-we-have-a-User-Agent-string-for-QGIS-td5360740.html
+    user_agent = QSettings().value("/qgis/networkAndProxy/userAgent", "Mozilla/5.0")
+    user_agent += " " if len(user_agent) else ""
+    # noinspection PyUnresolvedReferences
+    user_agent += f"QGIS/{Qgis.QGIS_VERSION_INT}"
+    user_agent += f" {name}"
+    return bytes(user_agent, encoding)
+
+
 def request_raw(
     url: str,
     method: Literal["get", "post"] = "get",
@@ -133,6 +203,7 @@ def request_raw(
     params: Optional[Dict[str, str]] = None,
     data: Optional[Dict[str, str]] = None,
     files: Optional[List[FileField]] = None,
+    user_agent: Optional[bytes] = None,
 ) -> Tuple[bytes, str]:
     """
     Request resource from the internet. Similar to requests.get(url) and
@@ -144,20 +215,21 @@ def request_raw(
     :param params: Dictionary to send in the query string
     :param data: Dictionary to send in the request body
     :param files: Files to send multipart-encoded. Same format as requests.
+    :param user_agent: User-Agent header value, defaults to one built from
+    the name of the calling plugin
     :return: bytes of the content and default name of the file or empty string
     """
     if params:
         url += f"?{urlencode(params)}"
     LOGGER.debug(url)
     req = QNetworkRequest(QUrl(url))
-    # http://osgeo-org.1560.x6.nabble.com/QGIS-Developer-Do-we-have-a-User-Agent-string-for-QGIS-td5360740.html
-    user_agent = QSettings().value("/qgis/networkAndProxy/userAgent", "Mozilla/5.0")
-    user_agent += " " if len(user_agent) else ""
-    # noinspection PyUnresolvedReferences
-    user_agent += f"QGIS/{Qgis.QGIS_VERSION_INT}"
-    user_agent += f" {plugin_name()}"
+    # plugin_name() is resolved on each request, since it depends on the
+    # calling plugin when qgis_plugin_tools is used as a dependency.
+    # Only the header building and the QSettings read are cached.
+    if user_agent is None:
+        user_agent = _user_agent(plugin_name(), encoding)
     # https://www.riverbankcomputing.com/pipermail/pyqt/2016-May/037514.html
-    req.setRawHeader(b"User-Agent", bytes(user_agent, encoding))
+    req.setRawHeader(b"User-Agent", user_agent)
     request_blocking = QgsBlockingNetworkRequest()
     if authcfg_id:
         request_blocking.setAuthCfg(authcfg_id)
@@ -175,31 +247,29 @@ def request_raw(
         elif files:
             # Support multipart binary. Generate boundary like
             # https://github.com/requests/toolbelt/blob/master/requests_toolbelt/multipart/encoder.py
-            boundary = uuid4().hex
+            boundary = secrets.token_hex(16)
             byte_boundary = bytes(f"\r\n--{boundary}\r\n", encoding)
             last_byte_boundary = bytes(f"\r\n--{boundary}--\r\n", encoding)
 
             # each file may have different content type, name and filename
-            byte_data = b""
+            chunks: List[bytes] = []
             for file_field in files:
                 name = file_field[0]
                 file_info = file_field[1]
                 file_name = file_info[0]
                 content = file_info[1]
                 content_type = file_info[2]
-                content_disposition_form_data = (
+                headers = (
                     f"Content-Disposition: form-data;"
                     f' name="{name}";'
                     f' filename="{file_name}"\r\n'
+                    f"Content-Type: {content_type}\r\n\r\n"
                 )
-                content_type_form_data = f"Content-Type: {content_type}\r\n\r\n"
-                byte_boundary_with_headers = (
-                    byte_boundary
-                    + bytes(content_disposition_form_data, encoding)
-                    + bytes(content_type_form_data, encoding)
-                )
-                byte_data += byte_boundary_with_headers + content
-            byte_data += last_byte_boundary
+                chunks.append(byte_boundary)
+                chunks.append(headers.encode(encoding))
+                chunks.append(content)
+            chunks.append(last_byte_boundary)
+            byte_data = b"".join(chunks)
             req.setRawHeader(
                 b"Content-Type",
                 bytes(f"multipart/form-data; boundary={boundary}", encoding),
@@ -214,11 +284,8 @@ def request_raw(
     if reply_error != QNetworkReply.NoError:
         # Error content will be empty in older QGIS versions:
         # https://github.com/qgis/QGIS/issues/42442
-        message = (
-            bytes(reply.content()).decode("utf-8")
-            if len(bytes(reply.content()))
-            else None
-        )
+        error_content = bytes(reply.content())
+        message = error_content.decode("utf-8") if error_content else None
         # bar_msg will just show a generic Qt error string.
         raise QgsPluginNetworkException(
             message=message,
@@ -230,13 +297,56 @@ def request_raw(
     default_name = ""
     if reply.hasRawHeader(CONTENT_DISPOSITION_BYTE_HEADER):
         header: QByteArray = reply.rawHeader(CONTENT_DISPOSITION_BYTE_HEADER)
-        default_name = bytes(header).decode(encoding).split("filename=")[1]
-        if default_name[0] in ['"', "'"]:
-            default_name = default_name[1:-1]
+        default_name = _content_disposition_filename(bytes(header).decode(encoding))
 
     return bytes(reply.content()), default_name
 
 
+def _content_disposition_filename(header: str) -> str:
+    """
+    Get the file name from a Content-Disposition header value
+    :param header: value of the header
+    :return: file name or empty string
+    """
+    matches = list(_CD_FILENAME_RE.finditer(header))
+    if not matches:
+        return ""
+    # filename* usually follows a plain ASCII filename fallback
+    match = next((match for match in matches if match.group(1)), matches[0])
+    extended, quoted, token = match.groups()
+    file_name = (quoted if quoted is not None else token).strip()
+    if extended:
+        # RFC 5987 value: charset'language'percent-encoded-name
+        parts = file_name.split("'", 2)
+        if len(parts) == 3:
+            charset, _, file_name = parts
+            try:
+                file_name = unquote(file_name, encoding=charset or ENCODING)
+            except LookupError:
+                file_name = unquote(file_name, encoding=ENCODING)
+    # the name must not point outside of the output directory
+    file_name = Path(file_name.strip("'")).name
+    return "" if file_name == ".." else file_name
+
+
+def _requests_session() -> "requests.Session":
+    """
+    Get the requests session shared by the downloads to reuse connections.
+    Cookies are not kept, so downloads do not share state with each other
+    """
+    global _SESSION
+
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+    return _SESSION
+
+
 def download_to_file(
     url: str,
     output_dir: Path,
@@ -274,7 +384,7 @@ def download_to_file(
         # https://stackoverflow.com/a/39217788/10068922
 
         try:
-            with requests.get(url, stream=True) as r:
+            with _requests_session().get(url, stream=True) as r:
                 try:
                     r.raise_for_status()
                 except Exception:
@@ -282,15 +392,12 @@ def download_to_file(
                         tr("Request failed with status code {}", r.status_code),
                         bar_msg=bar_msg(r.text),
                     )
-                default_filenames = re.findall(
-                    "filename=(.+)", r.headers.get(CONTENT_DISPOSITION_HEADER, "")
-                )
-                default_filename = (
-                    default_filenames[0] if len(default_filenames) else ""
+                default_filename = _content_disposition_filename(
+                    r.headers.get(CONTENT_DISPOSITION_HEADER, "")
                 )
                 output = get_output(default_filename)
                 with open(output, "wb") as f:
-                    shutil.copyfileobj(r.raw, f)
+                    shutil.copyfileobj(r.raw, f, DOWNLOAD_CHUNK_SIZE)
         except RequestException as e:
             raise QgsPluginNetworkException(tr("Request failed"), bar_msg=bar_msg(e))
     else:
@@ -2,6 +2,7 @@
 
 import configparser
 import importlib.resources
+import re
 import sys
 from os.path import abspath, dirname, exists, join, pardir
 from pathlib import Path
@@ -22,6 +23,9 @@ from qgis.core import QgsApplication
 PLUGIN_NAME: str = ""
 SLUG_NAME: str = ""
 
+_SECTION_RE = re.compile(r"^\[(?P<name>[^\]\n]+)\][ \t\r]*$", re.M)
+_KV_RE = re.compile(r"^(?P<k>[^=\s#;][^=\n]*?)[ \t]*=[ \t]*(?P<v>.*?)[ \t\r]*$", re.M)
+
 
 _TOP_LEVEL_NAME = __name__.split(".", maxsplit=1)[0]
 _IS_SUBMODULE_USAGE = _TOP_LEVEL_NAME != "qgis_plugin_tools"
@@ -194,6 +198,30 @@ def metadata_config() -> configparser.ConfigParser:
     return config
 
 
+def fast_parse_metadata(path: str) -> Dict[str, Dict[str, str]]:
+    """Parse a flat INI file such as metadata.txt without configparser.
+
+    Only a subset of the INI syntax is supported: ``[section]`` headers and
+    single line ``key = value`` pairs. Keys keep their case, values are not
+    interpolated, indented continuation lines of multiline values are skipped
+    and comments are only recognized on their own line.
+
+    :param path: Path to the file
+    :return: Dictionary of sections, each a dictionary of keys and values
+    """
+    with open(path, encoding="utf8") as f:
+        text = f.read()
+
+    sections: Dict[str, Dict[str, str]] = {}
+    headers = list(_SECTION_RE.finditer(text))
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        section = sections.setdefault(header.group("name"), {})
+        for match in _KV_RE.finditer(text, header.end(), end):
+            section[match.group("k")] = match.group("v")
+    return sections
+
+
 def qgis_plugin_ci_config() -> Optional[Dict]:
     """
     Get configuration of the ci config or None
@@ -1,6 +1,6 @@
 """QListWidget with fields selection."""
 # flake8: noqa ANN001, ANN204, ANN201
-from qgis.core import QgsVectorLayer
+from qgis.core import QgsField, QgsVectorLayer
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import QAbstractItemView, QListWidget, QListWidgetItem
 
@@ -22,17 +22,33 @@ class ListFieldsSelection(QListWidget):
 
         self.clear()
 
-        for field in self.layer.fields():
-            cell = QListWidgetItem()
-            alias = field.alias()
-            cell.setText(f"{field.name()} ({alias})" if alias else field.name())
-            cell.setData(Qt.UserRole, field.name())
-            index = layer.fields().indexFromName(field.name())
-            if index >= 0:
-                cell.setIcon(self.layer.fields().iconForField(index))
-            self.addItem(cell)
+        fields = layer.fields()
+        # avoid relayouting and repainting the list for each added field
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for index, field in enumerate(fields):
+                cell = QListWidgetItem()
+                alias = field.alias()
+                name = field.name()
+                cell.setText(f"{name} ({alias})" if alias else name)
+                cell.setData(Qt.UserRole, name)
+                cell.setIcon(fields.iconForField(index))
+                self.addItem(cell)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
     def set_selection(self, fields: tuple):
+        if not isinstance(fields, (set, frozenset, dict)):
+            try:
+                fields = frozenset(
+                    field.name() if isinstance(field, QgsField) else field
+                    for field in fields
+                )
+            except TypeError:
+                # unhashable item data, fall back to scanning the fields
+                pass
         for i in range(self.count()):
             item = self.item(i)
             item.setSelected(item.data(Qt.UserRole) in fields)
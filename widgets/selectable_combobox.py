@@ -23,44 +23,116 @@ class CheckableComboBox:
         self.model = QStandardItemModel(self.combo)
         self.combo.setModel(self.model)
         self.combo.setItemDelegate(QStyledItemDelegate())
+        # data of the checked items by row, kept up to date on item changes
+        self._selected = {}
+        # set while the edit text is updated to ignore the resulting signal
+        self._updating = False
         self.model.itemChanged.connect(self.combo_changed)
+        self.model.rowsInserted.connect(self._rows_inserted)
+        self.model.rowsRemoved.connect(self._reset_selection)
+        # sorting and moving rows change the rows of the checked items
+        self.model.rowsMoved.connect(self._reset_selection)
+        self.model.layoutChanged.connect(self._reset_selection)
+        self.model.modelReset.connect(self._reset_selection)
         self.combo.lineEdit().textChanged.connect(self.text_changed)
         if select_all:
             self.select_all = select_all
             self.select_all.clicked.connect(self.select_all_clicked)
 
+    def _all_items(self):
+        model = self.model
+        return (model.item(i) for i in range(model.rowCount()))
+
+    def _reset_selection(self, *args):
+        self._selected = {
+            row: item.data()
+            for row, item in enumerate(self._all_items())
+            if item.checkState() == Qt.Checked
+        }
+        self._update_text()
+
+    def _rows_inserted(self, parent, first, last):
+        if any(row >= first for row in self._selected):
+            # existing rows were shifted
+            self._reset_selection()
+            return
+        for row in range(first, last + 1):
+            item = self.model.item(row)
+            if item.checkState() == Qt.Checked:
+                self._selected[row] = item.data()
+        self._update_text()
+
+    def _update_text(self):
+        self._updating = True
+        try:
+            self.combo.setEditText(", ".join(self.selected_items()))
+        finally:
+            self._updating = False
+
     def select_all_clicked(self):
-        for item in self.model.findItems("*", Qt.MatchWildcard):
-            item.setCheckState(Qt.Checked)
+        self._updating = True
+        try:
+            for item in self._all_items():
+                item.setCheckState(Qt.Checked)
+        finally:
+            self._updating = False
+        self._update_text()
 
     def append_row(self, item: QStandardItem):
         """Add an item to the combobox."""
+        self._set_checkable(item)
+        self.model.appendRow(item)
+
+    def append_rows(self, items: list):
+        """Add multiple items to the combobox at once."""
+        for item in items:
+            self._set_checkable(item)
+        self.model.invisibleRootItem().appendRows(items)
+
+    @staticmethod
+    def _set_checkable(item: QStandardItem):
         item.setEnabled(True)
         item.setCheckable(True)
         item.setSelectable(False)
-        self.model.appendRow(item)
 
-    def combo_changed(self):
+    def combo_changed(self, item=None):
         """Slot when the combo has changed."""
-        self.text_changed(None)
+        if item is None:
+            self._reset_selection()
+            return
+        if item.checkState() == Qt.Checked:
+            self._selected[item.row()] = item.data()
+        else:
+            self._selected.pop(item.row(), None)
+        if not self._updating:
+            self._update_text()
 
     def selected_items(self) -> list:
-        return [
-            item.data()
-            for item in self.model.findItems("*", Qt.MatchWildcard)
-            if item.checkState() == Qt.Checked
-        ]
+        return [self._selected[row] for row in sorted(self._selected)]
 
     def set_selected_items(self, items):
-        for item in self.model.findItems("*", Qt.MatchWildcard):
-            checked = item.data() in items
-            item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        if not isinstance(items, (set, frozenset, dict)):
+            try:
+                items = frozenset(items)
+            except TypeError:
+                # unhashable item data, fall back to scanning the items
+                pass
+        self._updating = True
+        try:
+            for item in self._all_items():
+                checked = item.data() in items
+                item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        finally:
+            self._updating = False
+        self._update_text()
 
     def text_changed(self, text):
         """Update the preview with all selected items, separated by a comma."""
+        if self._updating:
+            return
         label = ", ".join(self.selected_items())
         if text != label:
-            self.combo.setEditText(label)
+            self._update_text()
 
 
 class CheckableFieldComboBox(CheckableComboBox):
@@ -78,9 +150,13 @@ class CheckableFieldComboBox(CheckableComboBox):
 
         self.layer = layer
 
-        for i, field in enumerate(self.layer.fields()):
+        fields = self.layer.fields()
+        items = []
+        for i, field in enumerate(fields):
             alias = field.alias()
-            item = QStandardItem(f"{field.name()} ({alias})" if alias else field.name())
-            item.setData(field.name())
-            item.setIcon(self.layer.fields().iconForField(i))
-            self.append_row(item)
+            name = field.name()
+            item = QStandardItem(f"{name} ({alias})" if alias else name)
+            item.setData(name)
+            item.setIcon(fields.iconForField(i))
+            items.append(item)
+        self.append_rows(items)